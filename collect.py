@@ -1,15 +1,51 @@
-import requests
 import csv
 import time
-from tradability import tradability_score
+
+import requests
+
+from tradability import tradability_scores
 
 # Kalshi API endpoint for market data
 URL = "https://api.elections.kalshi.com/trade-api/v2/markets"
 
+# Largest page the API accepts, so we need as few round trips as possible
+PAGE_LIMIT = 1000
+
+
+def fetch_page(session, cursor):
+    """
+    Fetch one page of open markets. Returns (markets, next_cursor);
+    next_cursor is empty/None on the last page.
+    """
+    params = {"status": "open", "limit": PAGE_LIMIT}
+    if cursor:
+        params["cursor"] = cursor
+    response = session.get(URL, params=params, timeout=20)
+    response.raise_for_status()
+    page = response.json()
+    return page.get("markets", []), page.get("cursor")
+
+
+def fetch_all_markets():
+    """
+    Fetch every open market, following the pagination cursor.
+
+    Each page's cursor comes from the previous page, so pages are requested
+    one after another, all over a single kept-alive connection (one
+    requests.Session) instead of a new connection per request.
+    """
+    with requests.Session() as session:
+        markets = []
+        cursor = None
+        while True:
+            page, cursor = fetch_page(session, cursor)
+            markets.extend(page)
+            if not cursor or not page:
+                return markets
+
+
 # Request all currently open markets from Kalshi
-response = requests.get(URL, params={"status": "open"}, timeout=20)
-response.raise_for_status()
-data = response.json()
+data = {"markets": fetch_all_markets()}
 
 # Open a CSV file to store market data
 ts = time.time()
@@ -34,14 +70,15 @@ with open("kalshi_markets.csv", "w", newline="") as f:
         "last_trade_price",
     ])
 
-    # Loop through each market returned by the API
+    # Build all rows first, then write them in one batch
+    rows = []
     for market in data["markets"]:
         # Skip illiquid markets (no YES-side orders or NO-side orders)
         if (
             market.get("yes_bid", 0) > 0 or market.get("yes_ask", 0) > 0 or
             market.get("no_bid", 0) > 0  or market.get("no_ask", 0) > 0
         ):      
-            writer.writerow([
+            rows.append([
                 ts,                                 # Time data was collected
                 market.get("ticker"),               # Unique market identifier
                 market.get("title"),                # Human-readable description
@@ -57,6 +94,7 @@ with open("kalshi_markets.csv", "w", newline="") as f:
                 market.get("open_interest"),        # Open contracts
                 market.get("last_trade_price"),     # Most recent execution price
             ])
+    writer.writerows(rows)
             
 def simplify_title(title: str, max_items: int = 3) -> str:
     if not title:
@@ -68,9 +106,9 @@ def simplify_title(title: str, max_items: int = 3) -> str:
         
 markets = data["markets"]
 
-# Score every market
-for market in markets:
-    score = tradability_score(market)
+# Score every market (vectorised over all markets at once)
+scores = tradability_scores(markets)
+for market, score in zip(markets, scores.tolist()):
     market["tradability_score"] = score
 
 # Sort by score
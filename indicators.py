@@ -23,10 +23,25 @@ Typical usage:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from numpy.typing import DTypeLike
+from pandas.api.typing import SeriesGroupBy
+
+# Optional: with numba installed the per-ticker time series run through our
+# own kernels (kernels.py). Without it we stay on pandas' Cython path.
+from kernels import NUMBA_AVAILABLE, fuse_pyes, groupwise_ewm, rolling_mean_std, rolling_minmax
+
+# Optional: polars backend for add_indicators (see the "Polars backend" section).
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Optional activity columns: if missing they are added as all-NaN, once per frame
+ACTIVITY_COLUMNS = ["volume", "open_interest"]
 
 
 # =============================================================================
@@ -52,6 +67,21 @@ class IndicatorConfig:
     # If p is below eps or above 1-eps, trading/execution can get weird
     near_bounds_eps: float = 0.05
 
+    # Storage dtype for price-derived columns (mids, spreads, p_yes and the
+    # rolling/ewm features on it). "float32" halves their memory traffic but
+    # whole-cent values then print with representation noise (0.91 becomes
+    # 0.90999997), so it is opt-in. Thresholds (near_bounds) are always
+    # decided in float64, and time columns (timestamp, tte_hours) always
+    # stay float64.
+    float_dtype: str = "float64"
+
+    def __post_init__(self) -> None:
+        # The rolling kernels keep a window-sized ring buffer / running sums,
+        # so a window needs at least one row.
+        for name in ("z_window", "vol_window", "range_window"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"{name} must be >= 1, got {getattr(self, name)}")
+
 
 # =============================================================================
 # Helper functions (vectorised)
@@ -64,7 +94,14 @@ def _to_numeric(series: pd.Series) -> pd.Series:
     return pd.to_numeric(series, errors="coerce")
 
 
-def _normalize_price_to_prob(x: pd.Series) -> pd.Series:
+def _to_float_array(series: pd.Series) -> np.ndarray:
+    """
+    _to_numeric, then hand back a plain float64 array (missing values -> NaN).
+    """
+    return _to_numeric(series).to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _normalize_price_to_prob(x: np.ndarray, dtype: DTypeLike = np.float64) -> np.ndarray:
     """
     Normalize Kalshi-style prices into probabilities in [0, 1].
 
@@ -76,191 +113,636 @@ def _normalize_price_to_prob(x: pd.Series) -> pd.Series:
     - Else assume it's already a probability-like number in [0, 1].
 
     This keeps your code robust even if your collector changes format later.
+
+    'x' is an already-numeric price array (see _to_float_array). Returns a
+    fresh array of `dtype`, scaled in place (one read-modify-write).
     """
-    x = _to_numeric(x)
+    arr = np.array(x, dtype=dtype)
     # If > 1.5 (would be > 1.0 but noise could make it 1.001), assume cents (e.g. 63 means 63 cents -> 0.63)
-    return x.where(x <= 1.5, x / 100.0).astype(float)
+    np.divide(arr, np.where(arr > 1.5, 100.0, 1.0), out=arr)
+    return arr
 
 
-def _has_book(bid: pd.Series, ask: pd.Series) -> pd.Series:
+def _has_book(bid: np.ndarray, ask: np.ndarray) -> np.ndarray:
     """
     A 'book exists' if both bid and ask are present and > 0.
+    Takes numeric price arrays (NaN compares as "not present").
     """
-    bid = _to_numeric(bid)
-    ask = _to_numeric(ask)
     return (bid > 0) & (ask > 0)
 
 
-def _mid(bid: pd.Series, ask: pd.Series) -> pd.Series:
+def _mid_from_arrays(bidp: np.ndarray, askp: np.ndarray, has: np.ndarray) -> np.ndarray:
+    """
+    Midpoint of already-normalized bid/ask probabilities,
+    but only valid where the book exists ('has'). Otherwise NaN.
+    """
+    mid = np.full_like(bidp, np.nan)
+    np.add(bidp, askp, out=mid, where=has)
+    np.divide(mid, 2.0, out=mid, where=has)
+    return mid
+
+
+def _spread_from_arrays(bidp: np.ndarray, askp: np.ndarray, has: np.ndarray) -> np.ndarray:
     """
-    Midpoint, but only valid where both bid and ask exist.
-    Otherwise NaN.
+    Absolute spread (in probability units, e.g. 0.04) of already-normalized
+    bid/ask probabilities, valid only where the book exists. Otherwise NaN.
     """
-    has = _has_book(bid, ask)
-    bidp = _normalize_price_to_prob(bid)
-    askp = _normalize_price_to_prob(ask)
-    mid = (bidp + askp) / 2.0
-    return mid.where(has, np.nan)
+    spr = np.full_like(bidp, np.nan)
+    np.subtract(askp, bidp, out=spr, where=has)
+    return spr
 
 
-def _spread(bid: pd.Series, ask: pd.Series) -> pd.Series:
+def _rel_spread(mid: np.ndarray, spread: np.ndarray) -> np.ndarray:
     """
-    Absolute spread (in probability units, e.g. 0.04),
-    valid only where book exists. Otherwise NaN.
+    Relative spread = spread / mid, on the mid/spread arrays.
+
+    Note: mid can be near 0; we guard by leaving rows with mid == 0 as NaN.
     """
-    has = _has_book(bid, ask)
-    bidp = _normalize_price_to_prob(bid)
-    askp = _normalize_price_to_prob(ask)
-    spr = askp - bidp
-    return spr.where(has, np.nan)
+    return np.divide(spread, mid, out=np.full_like(mid, np.nan), where=mid != 0)
 
 
-def _rel_spread(mid: pd.Series, spread: pd.Series) -> pd.Series:
+def _rolling_mean_std(
+    s: pd.Series,
+    keys: np.ndarray,
+    window: int,
+    dtype: DTypeLike,
+    group_starts: np.ndarray,
+) -> Tuple[pd.Series, pd.Series]:
     """
-    Relative spread = spread / mid.
+    Per-ticker rolling mean and std (ddof=1), stored as `dtype`.
 
-    Note: mid can be near 0; we guard by requiring mid > 0.
+    With numba both come from one O(n) pass of running sums
+    (kernels.rolling_mean_std); otherwise two pandas rolling aggregations.
+    Either way the sums are accumulated in float64.
     """
-    mid = _to_numeric(mid)
-    spread = _to_numeric(spread)
-    rel = spread / mid.replace(0, np.nan)
-    return rel
+    if NUMBA_AVAILABLE:
+        x = np.ascontiguousarray(s.to_numpy(dtype=dtype))
+        mu = np.full(len(x), np.nan, dtype=dtype)
+        sd = np.full(len(x), np.nan, dtype=dtype)
+        rolling_mean_std(x, window, group_starts, mu, sd)
+        return pd.Series(mu, index=s.index), pd.Series(sd, index=s.index)
 
+    roll = _by_ticker(s, keys).rolling(window, min_periods=window)
+    mu = _ungroup(roll.mean(), s.index).astype(dtype, copy=False)
+    sd = _ungroup(roll.std(), s.index).astype(dtype, copy=False)
+    return mu, sd
 
-def _zscore(series: pd.Series, window: int) -> pd.Series:
+
+def _zscore(s: pd.Series, keys: np.ndarray, window: int, dtype: DTypeLike, group_starts: np.ndarray) -> pd.Series:
     """
-    Rolling z-score (time-adaptive normalisation):
+    Rolling z-score per ticker (time-adaptive normalisation):
     - Uses a sliding window of the last `window` observations
     - Computes rolling mean and standard deviation
     - Returns (x - rolling_mean) / rolling_std
     - NaN until enough history exists (min_periods = window)
+
+    Mean and std share one pass (see _rolling_mean_std).
     """
-    s = _to_numeric(series)
-    mu = s.rolling(window, min_periods=window).mean()
-    sd = s.rolling(window, min_periods=window).std()
+    s = s.astype(dtype, copy=False)
+    mu, sd = _rolling_mean_std(s, keys, window, dtype, group_starts)
     return (s - mu) / sd
 
 
-def _rolling_vol(delta_series: pd.Series, window: int) -> pd.Series:
+def _rolling_vol(s: pd.Series, keys: np.ndarray, window: int, dtype: DTypeLike, group_starts: np.ndarray) -> pd.Series:
     """
-    Rolling volatility of returns/differences (std of delta).
+    Rolling volatility of returns/differences (std of delta) per ticker.
     """
-    d = _to_numeric(delta_series)
-    return d.rolling(window, min_periods=window).std()
+    if NUMBA_AVAILABLE:
+        return _rolling_mean_std(s, keys, window, dtype, group_starts)[1]
 
+    sd = _by_ticker(s, keys).rolling(window, min_periods=window).std()
+    return _ungroup(sd, s.index).astype(dtype, copy=False)
 
-def _rolling_range(series: pd.Series, window: int) -> pd.Series:
+
+def _rolling_range(
+    s: pd.Series,
+    keys: np.ndarray,
+    window: int,
+    dtype: DTypeLike,
+    group_starts: np.ndarray,
+) -> pd.Series:
     """
-    Rolling max-min over window.
+    Rolling max-min over window per ticker.
+
+    With numba, both extremes come from one monotonic-deque pass
+    (kernels.rolling_minmax); otherwise two pandas rolling passes.
     """
-    s = _to_numeric(series)
-    rmax = s.rolling(window, min_periods=window).max()
-    rmin = s.rolling(window, min_periods=window).min()
-    return rmax - rmin
+    if NUMBA_AVAILABLE:
+        x = np.ascontiguousarray(s.to_numpy(dtype=dtype))
+        rmin = np.full(len(x), np.nan, dtype=dtype)
+        rmax = np.full(len(x), np.nan, dtype=dtype)
+        rolling_minmax(x, window, group_starts, rmin, rmax)
+        return pd.Series(rmax - rmin, index=s.index)
 
+    roll = _by_ticker(s, keys).rolling(window, min_periods=window)
+    rng = _ungroup(roll.max(), s.index) - _ungroup(roll.min(), s.index)
+    return rng.astype(dtype, copy=False)
 
-def _ema(series: pd.Series, span: int) -> pd.Series:
+
+def _ema(s: pd.Series, keys: np.ndarray, span: int, dtype: DTypeLike, group_starts: np.ndarray) -> pd.Series:
     """
-    Exponential moving average.
+    Exponential moving average per ticker.
     adjust=False is typical for trading signals.
+
+    With numba this is a single recurrence per ticker (kernels.groupwise_ewm);
+    otherwise pandas' groupby-ewm.
+    """
+    if NUMBA_AVAILABLE:
+        # Same span -> alpha conversion as pandas (via center of mass)
+        alpha = 1.0 / (1.0 + (span - 1) / 2.0)
+        out = np.empty(len(s), dtype=dtype)
+        groupwise_ewm(np.ascontiguousarray(s.to_numpy(dtype=dtype)), group_starts, alpha, out)
+        return pd.Series(out, index=s.index)
+
+    ema = _by_ticker(s, keys).ewm(span=span, adjust=False).mean()
+    return _ungroup(ema, s.index).astype(dtype, copy=False)
+
+
+def _by_ticker(s: pd.Series, keys: np.ndarray) -> SeriesGroupBy:
     """
-    s = _to_numeric(series)
-    return s.ewm(span=span, adjust=False).mean()
+    Group a column of the sorted frame by its integer ticker codes.
+
+    sort=False keeps groups in frame order (the frame is already sorted).
+    A missing ticker has code -1, which is just another group, so every
+    per-ticker result has exactly one value per row, in frame order.
+    """
+    return s.groupby(keys, sort=False)
+
+
+def _ungroup(s: pd.Series, index: pd.Index) -> pd.Series:
+    """
+    groupby-rolling/ewm results come back with a 'ticker' level prepended to
+    the index. Their values are already in frame order (see _by_ticker), so
+    just put the frame's index back. Positional, so duplicate labels are fine.
+    """
+    return pd.Series(s.to_numpy(), index=index)
+
+
+def _p_yes_features(
+    mid_yes: np.ndarray,
+    mid_no: np.ndarray,
+    keys: np.ndarray,
+    cfg: IndicatorConfig,
+    dtype: DTypeLike,
+    group_starts: np.ndarray,
+) -> Dict[str, Union[np.ndarray, pd.Series]]:
+    """
+    p_yes plus the features that only look at p_yes row-to-row:
+    overround, delta_p, accel_p and near_bounds.
+
+    mid_yes/mid_no are float64; p_yes is worked out and checked against the
+    near-bounds thresholds in float64, then stored as `dtype`.
+
+    With numba these all come out of one fused pass over mid_yes/mid_no
+    (kernels.fuse_pyes); otherwise they're built column by column in pandas.
+    """
+    eps = cfg.near_bounds_eps
+    dtype = np.dtype(dtype)
+
+    if NUMBA_AVAILABLE:
+        n = len(mid_yes)
+        out = {name: np.empty(n, dtype=dtype) for name in ("p_yes", "overround", "delta_p", "accel_p")}
+        out["near_bounds"] = np.empty(n, dtype=np.bool_)
+        fuse_pyes(
+            np.ascontiguousarray(mid_yes, dtype=np.float64), np.ascontiguousarray(mid_no, dtype=np.float64),
+            eps, 1.0 - eps, group_starts,
+            out["p_yes"], out["overround"], out["delta_p"], out["accel_p"],
+            out["near_bounds"],
+        )
+        return out
+
+    # Preferred: use both YES and NO mids and normalize.
+    # This reduces distortion when one side is slightly off.
+    # If you sometimes don't have NO book (denominator not positive), fall
+    # back to YES mid directly: out starts as mid_yes and the division only
+    # writes where denom > 0, so this is one pass and one allocation.
+    denom = mid_yes + mid_no
+    p_full = np.divide(mid_yes, denom, out=np.array(mid_yes, copy=True), where=denom > 0)
+    p = pd.Series(p_full.astype(dtype, copy=False))
+
+    by_ticker = _by_ticker(p, keys)
+    delta = by_ticker.diff()
+
+    return {
+        "p_yes": p,
+        # Ideally mid_yes + mid_no == 1. Deviations indicate friction/staleness.
+        "overround": (denom - 1.0).astype(dtype, copy=False),
+        "delta_p": delta,
+        "accel_p": _by_ticker(delta, keys).diff(),
+        "near_bounds": (p_full < eps) | (p_full > 1.0 - eps),
+    }
+
+
+def _quote_cents(bidp: np.ndarray, askp: np.ndarray, has: np.ndarray) -> np.ndarray:
+    """
+    bid + ask of one side of the book as an integer number of cents, or -1
+    where that book is missing. Kalshi quotes are whole cents, so comparing
+    these is exact where comparing normalized float probabilities isn't.
+    A non-finite quote (e.g. inf) is treated like a missing book.
+
+    Takes the already-normalized probabilities; the sum is scaled and
+    rounded in place and copied into the int32 result only where valid.
+    """
+    cents = np.add(bidp, askp)
+    np.multiply(cents, 100.0, out=cents)
+    np.rint(cents, out=cents)
+    out = np.full(len(cents), -1, dtype=np.int32)
+    np.copyto(out, cents, casting="unsafe", where=has & np.isfinite(cents))
+    return out
+
+
+def _is_unchanged(
+    yes_cents: np.ndarray,
+    no_cents: np.ndarray,
+    has_yes: np.ndarray,
+    group_starts: np.ndarray,
+) -> np.ndarray:
+    """
+    Staleness flag: the row has a YES book and both sides quote the same
+    cents as the previous row of the same ticker (so p_yes can't have
+    moved). Integer compares against the previous row, then False at the
+    first row of every ticker.
+    """
+    out = np.zeros(len(yes_cents), dtype=np.bool_)
+    out[1:] = has_yes[1:] & (yes_cents[1:] == yes_cents[:-1]) & (no_cents[1:] == no_cents[:-1])
+    if len(out):
+        out[group_starts[:-1]] = False
+    return out
+
+
+def _group_starts(codes: np.ndarray) -> np.ndarray:
+    """
+    Start offset of each ticker's contiguous block in the sorted frame,
+    plus a final entry equal to the number of rows (the layout kernels.py
+    expects).
+
+    The frame is sorted by ticker, so a new block starts wherever the
+    ticker code changes: one np.diff, no hashing or sorting.
+    """
+    return np.concatenate([[0], np.flatnonzero(np.diff(codes)) + 1, [len(codes)]]).astype(np.int64)
+
+
+def _group_diff(x: np.ndarray, group_starts: np.ndarray) -> np.ndarray:
+    """
+    Per-ticker first difference of a column of the sorted frame (like
+    groupby(...).diff()): one array subtraction, then NaN at the first row
+    of every ticker.
+    """
+    out = np.empty_like(x)
+    out[:1] = np.nan
+    np.subtract(x[1:], x[:-1], out=out[1:])
+    if len(x):
+        out[group_starts[:-1]] = np.nan
+    return out
+
+
+def _warm_numba() -> None:
+    """
+    Compile the numba kernels once on tiny dummy inputs, so the first real
+    call to add_indicators doesn't pay the JIT compile latency.
+    No-op when numba isn't installed.
+
+    Only the default float64 specializations are warmed; float32 storage is
+    opt-in and numba compiles (and caches) it on first use.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+
+    starts = np.array([0, 2, 3], dtype=np.int64)
+    x = np.array([0.1, 0.2, 0.3])
+    rolling_minmax(x, 2, starts, np.full(3, np.nan), np.full(3, np.nan))
+    rolling_mean_std(x, 2, starts, np.full(3, np.nan), np.full(3, np.nan))
+    groupwise_ewm(x, starts, 0.5, np.empty(3))
+    fuse_pyes(
+        x, x, 0.05, 0.95, starts,
+        *(np.empty(3) for _ in range(4)),
+        np.empty(3, dtype=np.bool_),
+    )
+
+_warm_numba()
 
 
 # =============================================================================
-# Core indicator computation per ticker
+# Core indicator computation (all tickers at once)
 # =============================================================================
 
-def _compute_group_indicators(g: pd.DataFrame, cfg: IndicatorConfig) -> pd.DataFrame:
+def _compute_indicators(df: pd.DataFrame, cfg: IndicatorConfig) -> Dict[str, np.ndarray]:
     """
-    Compute indicators for a single ticker group 'g' (already sorted by timestamp).
-    Returns a copy with new columns.
-    """
-    g = g.copy()
+    Compute indicators for every ticker in one pass over the frame.
+
+    'df' must already be sorted by (ticker, timestamp). Row-wise features are
+    computed on the whole frame; time-series features are grouped by ticker
+    so rolling/ewm/diff/shift never cross ticker boundaries.
 
-    # --- Basic book existence flags ---
-    g["has_yes_book"] = _has_book(g["yes_bid"], g["yes_ask"])
-    g["has_no_book"] = _has_book(g["no_bid"], g["no_ask"])
+    'df' is only read. Returns the indicator columns (in output order) as
+    arrays aligned positionally with 'df', so the caller can attach them to
+    the frame in a single assignment.
+    """
+    cols: Dict[str, Union[np.ndarray, pd.Series]] = {}
+    # Integer ticker codes: cheap groupby keys, and the basis for the
+    # contiguous per-ticker blocks the numba kernels work on.
+    keys = pd.Categorical(df["ticker"]).codes.astype(np.int32)
+
+    # --- Raw book prices: coerce each column to numeric exactly once ---
+    yb = _to_float_array(df["yes_bid"])
+    ya = _to_float_array(df["yes_ask"])
+    nb = _to_float_array(df["no_bid"])
+    na = _to_float_array(df["no_ask"])
+
+    # --- Basic book existence flags (computed once, reused below) ---
+    has_yes = _has_book(yb, ya)
+    has_no = _has_book(nb, na)
+    cols["has_yes_book"] = has_yes
+    cols["has_no_book"] = has_no
+
+    # --- Normalize each price column once, reuse for mid and spread ---
+    # Row-wise price math runs in float64; everything derived from prices is
+    # stored as cfg.float_dtype.
+    dtype = np.dtype(cfg.float_dtype)
+    yes_bid_p = _normalize_price_to_prob(yb)
+    yes_ask_p = _normalize_price_to_prob(ya)
+    no_bid_p = _normalize_price_to_prob(nb)
+    no_ask_p = _normalize_price_to_prob(na)
 
     # --- Mid and spread for YES and NO ---
-    g["mid_yes"] = _mid(g["yes_bid"], g["yes_ask"])
-    g["mid_no"] = _mid(g["no_bid"], g["no_ask"])
+    mid_yes = _mid_from_arrays(yes_bid_p, yes_ask_p, has_yes)
+    mid_no = _mid_from_arrays(no_bid_p, no_ask_p, has_no)
+    cols["mid_yes"] = mid_yes.astype(dtype, copy=False)
+    cols["mid_no"] = mid_no.astype(dtype, copy=False)
 
-    g["spread_yes"] = _spread(g["yes_bid"], g["yes_ask"])
-    g["spread_no"] = _spread(g["no_bid"], g["no_ask"])
+    spread_yes = _spread_from_arrays(yes_bid_p, yes_ask_p, has_yes)
+    cols["spread_yes"] = spread_yes.astype(dtype, copy=False)
+    cols["spread_no"] = _spread_from_arrays(no_bid_p, no_ask_p, has_no).astype(dtype, copy=False)
 
     # A simple "relative spread" based on YES mid/spread.
     # If YES book missing, rel_spread will be NaN.
-    g["rel_spread_yes"] = _rel_spread(g["mid_yes"], g["spread_yes"])
+    cols["rel_spread_yes"] = _rel_spread(mid_yes, spread_yes).astype(dtype, copy=False)
 
-    # --- Implied probability p (YES) ---
-    # Preferred: use both YES and NO mids and normalize.
-    # This reduces distortion when one side is slightly off.
-    denom = (g["mid_yes"] + g["mid_no"])
-    g["p_yes"] = (g["mid_yes"] / denom).where(denom > 0, np.nan)
+    # Contiguous per-ticker row blocks of the sorted frame (for kernels.py)
+    group_starts = _group_starts(keys)
 
-    # If you sometimes don't have NO book, fallback to YES mid directly.
-    g["p_yes"] = g["p_yes"].fillna(g["mid_yes"])
+    # --- Implied probability p (YES) and its row-to-row features ---
+    # p_yes, overround, delta_p, accel_p and near_bounds are computed
+    # together (one fused pass with numba), then placed below.
+    p_feats = _p_yes_features(mid_yes, mid_no, keys, cfg, dtype, group_starts)
+    p = pd.Series(p_feats["p_yes"], index=df.index)
+    cols["p_yes"] = p
 
     # --- Overround / consistency ---
-    # Ideally mid_yes + mid_no == 1. Deviations indicate friction/staleness.
-    g["overround"] = (g["mid_yes"] + g["mid_no"]) - 1.0
+    cols["overround"] = p_feats["overround"]
 
     # --- Time to expiry (hours) ---
     # close_time might be missing for some markets; coerce to numeric.
-    ts = _to_numeric(g["timestamp"])
-    ct = _to_numeric(g["close_time"])
-    g["tte_hours"] = (ct - ts) / 3600.0
+    ts = _to_float_array(df["timestamp"])
+    ct = _to_float_array(df["close_time"])
+    cols["tte_hours"] = (ct - ts) / 3600.0
 
     # --- Volume / open interest (levels & changes) ---
-    g["volume"] = _to_numeric(g.get("volume", np.nan))
-    g["open_interest"] = _to_numeric(g.get("open_interest", np.nan))
+    # Both columns are guaranteed (and numeric) by add_indicators, so the
+    # levels stay as they are in the frame (integer counts stay integers) and
+    # only the diffs below read them as float arrays.
+    volume = df["volume"].to_numpy(dtype=np.float64, na_value=np.nan)
+    open_interest = df["open_interest"].to_numpy(dtype=np.float64, na_value=np.nan)
 
     # Changes are often more informative than levels
-    g["d_volume"] = g["volume"].diff()
-    g["d_open_interest"] = g["open_interest"].diff()
+    cols["d_volume"] = _group_diff(volume, group_starts)
+    cols["d_open_interest"] = _group_diff(open_interest, group_starts)
 
     # --- Price changes (returns) ---
-    g["delta_p"] = _to_numeric(g["p_yes"]).diff()
+    delta_p = pd.Series(p_feats["delta_p"], index=df.index)
+    cols["delta_p"] = delta_p
 
     # --- Mean reversion / normalization ---
-    g["z_p"] = _zscore(g["p_yes"], cfg.z_window)
+    cols["z_p"] = _zscore(p, keys, cfg.z_window, dtype, group_starts)
 
     # --- Volatility & range ---
-    g["vol_p"] = _rolling_vol(g["delta_p"], cfg.vol_window)
-    g["range_p"] = _rolling_range(g["p_yes"], cfg.range_window)
+    cols["vol_p"] = _rolling_vol(delta_p, keys, cfg.vol_window, dtype, group_starts)
+    cols["range_p"] = _rolling_range(p, keys, cfg.range_window, dtype, group_starts)
 
     # --- Momentum & trend ---
-    g["momentum_p"] = _to_numeric(g["p_yes"]) - _to_numeric(g["p_yes"]).shift(cfg.momentum_lag)
+    cols["momentum_p"] = p - _by_ticker(p, keys).shift(cfg.momentum_lag)
 
-    ema_fast = _ema(g["p_yes"], cfg.ema_fast)
-    ema_slow = _ema(g["p_yes"], cfg.ema_slow)
-    g["ema_fast"] = ema_fast
-    g["ema_slow"] = ema_slow
-    g["ema_diff"] = ema_fast - ema_slow
+    ema_fast = _ema(p, keys, cfg.ema_fast, dtype, group_starts)
+    ema_slow = _ema(p, keys, cfg.ema_slow, dtype, group_starts)
+    cols["ema_fast"] = ema_fast
+    cols["ema_slow"] = ema_slow
+    cols["ema_diff"] = ema_fast - ema_slow
 
     # --- Acceleration (second difference) ---
-    g["accel_p"] = g["delta_p"].diff()
+    cols["accel_p"] = p_feats["accel_p"]
 
     # --- Near-bounds flag (execution often worse near 0/1) ---
-    p = _to_numeric(g["p_yes"])
-    eps = cfg.near_bounds_eps
-    g["near_bounds"] = (p < eps) | (p > 1.0 - eps)
+    cols["near_bounds"] = p_feats["near_bounds"]
 
     # --- A simple "staleness proxy" ---
     # If price doesn't change across snapshots, it may be stale.
     # (This is NOT perfect staleness, but it's cheap and useful.)
-    g["is_unchanged"] = (p == p.shift(1))
+    # Compared on the integer cent quotes rather than on float p_yes.
+    cols["is_unchanged"] = _is_unchanged(
+        _quote_cents(yes_bid_p, yes_ask_p, has_yes), _quote_cents(no_bid_p, no_ask_p, has_no),
+        has_yes, group_starts,
+    )
+
+    return {name: np.asarray(col) for name, col in cols.items()}
+
+
+# =============================================================================
+# Polars backend (optional)
+# =============================================================================
+#
+# Same indicators expressed as a lazy polars query: every per-ticker operation
+# is a window expression (`.over("ticker")`), so the engine can run them in
+# parallel across tickers and columns. Each `with_columns` stage only depends
+# on columns produced by the previous stage.
+
+def _pl_num(col: str) -> "pl.Expr":
+    """
+    Polars equivalent of _to_numeric: cast to float, bad values become null.
+
+    NaN is turned into null as well: polars orders NaN above every number, so
+    a NaN bid/ask would otherwise pass the `> 0` book checks that treat it as
+    missing on the pandas side.
+    """
+    return pl.col(col).cast(pl.Float64, strict=False).fill_nan(None)
+
+
+def _pl_prob(col: str) -> "pl.Expr":
+    """
+    Polars equivalent of _normalize_price_to_prob (cents -> probability).
+    """
+    x = _pl_num(col)
+    return pl.when(x > 1.5).then(x / 100.0).otherwise(x)
+
+
+def _pl_has_book(bid: str, ask: str) -> "pl.Expr":
+    """
+    Polars equivalent of _has_book (missing values count as "no book").
+    """
+    return ((_pl_num(bid) > 0) & (_pl_num(ask) > 0)).fill_null(False)
+
+
+def _pl_mid(bid: str, ask: str) -> "pl.Expr":
+    """
+    Polars equivalent of _mid_from_arrays: null where the book is missing.
+    """
+    return pl.when(_pl_has_book(bid, ask)).then((_pl_prob(bid) + _pl_prob(ask)) / 2.0)
+
+
+def _pl_quote_cents(bid: str, ask: str) -> "pl.Expr":
+    """
+    Polars equivalent of _quote_cents: integer bid + ask cents, -1 where the
+    book is missing.
+
+    `when` still evaluates the cents on every row, so the cast is non-strict:
+    a value that doesn't fit Int32 (e.g. inf) becomes null instead of failing
+    the whole query, and is then treated like a missing book (-1), as in
+    _quote_cents.
+    """
+    cents = ((_pl_prob(bid) + _pl_prob(ask)) * 100.0).round(0).cast(pl.Int32, strict=False)
+    return pl.when(_pl_has_book(bid, ask)).then(cents).otherwise(-1).fill_null(-1)
+
+
+def _pl_spread(bid: str, ask: str) -> "pl.Expr":
+    """
+    Polars equivalent of _spread_from_arrays: null where the book is missing.
+    """
+    return pl.when(_pl_has_book(bid, ask)).then(_pl_prob(ask) - _pl_prob(bid))
+
+
+def add_indicators_lazy(lf: "pl.LazyFrame", cfg: Optional[IndicatorConfig] = None) -> "pl.LazyFrame":
+    """
+    Add indicator columns to a polars LazyFrame of market snapshots.
+
+    Same expectations and output columns as add_indicators. Nothing is
+    computed until the caller runs `.collect()` on the result (use
+    `.collect(engine="streaming")` if the data doesn't fit in RAM).
+
+    EMA spans of 3 are rejected: pandas (and kernels.groupwise_ewm)
+    special-case alpha 0.5 after missing prices, which polars' ewm_mean
+    doesn't, so the EMAs would silently differ from the pandas backend.
+    """
+    if pl is None:
+        raise ImportError("polars is required for add_indicators_lazy (pip install polars)")
+    if cfg is None:
+        cfg = IndicatorConfig()
+
+    for name in ("ema_fast", "ema_slow"):
+        if getattr(cfg, name) == 3:
+            raise ValueError(
+                f"{name}=3 (alpha 0.5) is not supported by the polars backend: "
+                "pandas weights it differently after gaps. Use the pandas backend."
+            )
 
-    return g
+    schema = lf.collect_schema()
+    columns = schema.names()
+    required = ["ticker", "timestamp", "close_time", "yes_bid", "yes_ask", "no_bid", "no_ask"]
+    missing = [c for c in required if c not in columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    # Volume / open interest are optional inputs; keep numeric columns as-is.
+    activity: List["pl.Expr"] = []
+    for col in ACTIVITY_COLUMNS:
+        if col not in columns:
+            activity.append(pl.lit(None, dtype=pl.Float64).alias(col))
+        elif not schema[col].is_numeric():
+            activity.append(_pl_num(col).alias(col))
+
+    p = pl.col("p_yes")
+    denom = pl.col("mid_yes") + pl.col("mid_no")
+    # pandas' ewm carries the last value through missing prices; polars emits
+    # null there, so forward-fill within the ticker to match.
+    ema_fast = p.ewm_mean(span=cfg.ema_fast, adjust=False).forward_fill().over("ticker")
+    ema_slow = p.ewm_mean(span=cfg.ema_slow, adjust=False).forward_fill().over("ticker")
+    eps = cfg.near_bounds_eps
+
+    out = (
+        lf
+        # Sort once globally to make group sorting consistent and stable
+        .with_columns(_pl_num("timestamp").alias("timestamp"))
+        .sort(["ticker", "timestamp"], nulls_last=True, maintain_order=True)
+        # --- Book flags, mids and spreads ---
+        .with_columns(
+            _pl_has_book("yes_bid", "yes_ask").alias("has_yes_book"),
+            _pl_has_book("no_bid", "no_ask").alias("has_no_book"),
+            _pl_mid("yes_bid", "yes_ask").alias("mid_yes"),
+            _pl_mid("no_bid", "no_ask").alias("mid_no"),
+            _pl_spread("yes_bid", "yes_ask").alias("spread_yes"),
+            _pl_spread("no_bid", "no_ask").alias("spread_no"),
+            _pl_quote_cents("yes_bid", "yes_ask").alias("_yes_cents"),
+            _pl_quote_cents("no_bid", "no_ask").alias("_no_cents"),
+        )
+        # --- Row-wise features derived from the mids ---
+        .with_columns(
+            pl.when(pl.col("mid_yes") != 0)
+            .then(pl.col("spread_yes") / pl.col("mid_yes"))
+            .alias("rel_spread_yes"),
+            pl.when(denom > 0).then(pl.col("mid_yes") / denom).otherwise(pl.col("mid_yes")).alias("p_yes"),
+            (denom - 1.0).alias("overround"),
+            ((_pl_num("close_time") - pl.col("timestamp")) / 3600.0).alias("tte_hours"),
+            *activity,
+        )
+        # --- Per-ticker time-series features on p_yes ---
+        .with_columns(
+            pl.col("volume").diff().over("ticker").alias("d_volume"),
+            pl.col("open_interest").diff().over("ticker").alias("d_open_interest"),
+            p.diff().over("ticker").alias("delta_p"),
+            (
+                (p - p.rolling_mean(cfg.z_window).over("ticker"))
+                / p.rolling_std(cfg.z_window).over("ticker")
+            ).alias("z_p"),
+            (
+                p.rolling_max(cfg.range_window).over("ticker")
+                - p.rolling_min(cfg.range_window).over("ticker")
+            ).alias("range_p"),
+            (p - p.shift(cfg.momentum_lag).over("ticker")).alias("momentum_p"),
+            ema_fast.alias("ema_fast"),
+            ema_slow.alias("ema_slow"),
+            (ema_fast - ema_slow).alias("ema_diff"),
+            ((p < eps) | (p > 1.0 - eps)).fill_null(False).alias("near_bounds"),
+            (
+                pl.col("has_yes_book")
+                & (pl.col("_yes_cents") == pl.col("_yes_cents").shift(1).over("ticker"))
+                & (pl.col("_no_cents") == pl.col("_no_cents").shift(1).over("ticker"))
+            ).fill_null(False).alias("is_unchanged"),
+        )
+        # --- Features of delta_p ---
+        .with_columns(
+            pl.col("delta_p").rolling_std(cfg.vol_window).over("ticker").alias("vol_p"),
+            pl.col("delta_p").diff().over("ticker").alias("accel_p"),
+        )
+    )
+
+    # Price-derived columns use the same storage dtype as the pandas path
+    float_dtype = {"float32": pl.Float32, "float64": pl.Float64}[np.dtype(cfg.float_dtype).name]
+    price_cols = [
+        "mid_yes", "mid_no", "spread_yes", "spread_no", "rel_spread_yes", "p_yes", "overround",
+        "delta_p", "z_p", "vol_p", "range_p", "momentum_p", "ema_fast", "ema_slow", "ema_diff", "accel_p",
+    ]
+    out = out.with_columns(pl.col(price_cols).cast(float_dtype))
+
+    # Same column order as the pandas path: inputs first, then new columns
+    added = [
+        "has_yes_book", "has_no_book", "mid_yes", "mid_no", "spread_yes", "spread_no",
+        "rel_spread_yes", "p_yes", "overround", "tte_hours",
+        "d_volume", "d_open_interest", "delta_p", "z_p", "vol_p", "range_p", "momentum_p",
+        "ema_fast", "ema_slow", "ema_diff", "accel_p", "near_bounds", "is_unchanged",
+    ]
+    # Missing activity columns go right after the inputs, where add_indicators
+    # puts them too
+    activity_cols = [c for c in ACTIVITY_COLUMNS if c not in columns]
+    return out.select(columns + activity_cols + [c for c in added if c not in columns])
 
 
 # =============================================================================
 # Public API
 # =============================================================================
 
-def add_indicators(df: pd.DataFrame, cfg: Optional[IndicatorConfig] = None) -> pd.DataFrame:
+def add_indicators(
+    df: pd.DataFrame,
+    cfg: Optional[IndicatorConfig] = None,
+    backend: str = "pandas",
+) -> pd.DataFrame:
     """
     Add indicator columns to a market snapshot DataFrame.
 
@@ -269,27 +751,57 @@ def add_indicators(df: pd.DataFrame, cfg: Optional[IndicatorConfig] = None) -> p
     - df may contain repeated snapshots for the same ticker across time.
     - df has a 'timestamp' column so we can order within each ticker.
 
+    backend:
+    - "pandas" (default): vectorised groupby over the sorted frame.
+    - "polars": run add_indicators_lazy and convert back to pandas
+      (requires polars).
+
     Returns:
-    - A new DataFrame with indicator columns appended.
+    - A new DataFrame, sorted by (ticker, timestamp) with a fresh RangeIndex
+      and a categorical 'ticker', with indicator columns appended.
     """
     if cfg is None:
         cfg = IndicatorConfig()
 
+    if backend == "polars":
+        if pl is None:
+            raise ImportError("polars is required for backend='polars' (pip install polars)")
+        return add_indicators_lazy(pl.from_pandas(df).lazy(), cfg).collect().to_pandas()
+    if backend != "pandas":
+        raise ValueError(f"Unknown backend: {backend!r} (expected 'pandas' or 'polars')")
+
     required = ["ticker", "timestamp", "close_time", "yes_bid", "yes_ask", "no_bid", "no_ask"]
     missing = [c for c in required if c not in df.columns]
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
-    # Sort once globally to make group sorting consistent and stable
-    df_sorted = df.copy()
-    df_sorted["timestamp"] = _to_numeric(df_sorted["timestamp"])
-    df_sorted = df_sorted.sort_values(["ticker", "timestamp"], kind="mergesort")
-
-    # Compute per-ticker indicators
-    out = (
-        df_sorted
-        .groupby("ticker", group_keys=False)
-        .apply(lambda g: _compute_group_indicators(g, cfg))
+    # Sort once globally to make group sorting consistent and stable.
+    # sort_values already returns a new frame, so the input is never copied
+    # up front or modified. Sorting on a categorical ticker compares integer
+    # codes instead of Python strings; the sorted frame keeps it categorical
+    # so every per-ticker groupby works on codes too.
+    sort_keys = {"ticker": df["ticker"].astype("category"), "timestamp": _to_numeric(df["timestamp"])}
+    df_sorted = df.sort_values(
+        ["ticker", "timestamp"],
+        kind="mergesort",
+        ignore_index=True,
+        key=lambda col: sort_keys[col.name],
     )
+    df_sorted["ticker"] = df_sorted["ticker"].astype("category")
+    df_sorted["timestamp"] = _to_numeric(df_sorted["timestamp"])
 
-    return out
+    # Volume / open interest are optional inputs: resolve them once for the
+    # whole frame (all-NaN if absent, numeric otherwise) instead of defaulting
+    # and coercing inside the indicator code.
+    for col in ACTIVITY_COLUMNS:
+        if col not in df_sorted.columns:
+            df_sorted[col] = np.full(len(df_sorted), np.nan)
+        elif not pd.api.types.is_numeric_dtype(df_sorted[col]):
+            df_sorted[col] = _to_numeric(df_sorted[col])
+
+    # Compute indicators for all tickers at once (no per-ticker Python callback)
+    # and attach them in a single assignment instead of column by column.
+    cols = _compute_indicators(df_sorted, cfg)
+    df_sorted[list(cols)] = pd.DataFrame(cols, index=df_sorted.index)
+
+    return df_sorted
@@ -0,0 +1,259 @@
+"""
+kernels.py
+
+Numba-compiled kernels for the per-ticker time-series indicators.
+
+All kernels work on a frame that is sorted by (ticker, timestamp), so each
+ticker's rows are one contiguous slice. `group_starts` holds the start offset
+of every ticker plus a final entry equal to the number of rows, i.e. ticker g
+owns rows group_starts[g]:group_starts[g + 1]. Kernels loop over tickers in
+parallel (`prange`) and never let state cross a ticker boundary.
+
+numba is optional: check NUMBA_AVAILABLE before calling anything here.
+Without numba the functions still import (as plain Python) so this module is
+always safe to import, but indicators.py falls back to pandas instead of
+running these loops in the interpreter.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit that leaves the function as plain Python.
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+# =============================================================================
+# Rolling min / max
+# =============================================================================
+
+@njit(cache=True)
+def _minmax_segment(x, w, start, end, out_min, out_max):
+    """
+    Rolling min and max over x[start:end] with the monotonic deque algorithm.
+
+    Two ring buffers hold row indices whose values are monotonically
+    increasing (min deque) / decreasing (max deque), so each row is pushed
+    and popped at most once: O(n) for both outputs in a single pass.
+
+    Matches pandas' rolling(w, min_periods=w): a row gets a value only when
+    the last w rows of its ticker are all non-NaN.
+    """
+    qmin = np.empty(w, dtype=np.int64)
+    qmax = np.empty(w, dtype=np.int64)
+    min_head = 0
+    min_len = 0
+    max_head = 0
+    max_len = 0
+    last_nan = start - 1
+
+    for i in range(start, end):
+        v = x[i]
+
+        # Evict indices that slid out of the window (i - w, i]
+        if min_len > 0 and qmin[min_head] <= i - w:
+            min_head = (min_head + 1) % w
+            min_len -= 1
+        if max_len > 0 and qmax[max_head] <= i - w:
+            max_head = (max_head + 1) % w
+            max_len -= 1
+
+        if np.isnan(v):
+            last_nan = i
+        else:
+            # Pop from the back while the new value dominates
+            while min_len > 0 and x[qmin[(min_head + min_len - 1) % w]] >= v:
+                min_len -= 1
+            qmin[(min_head + min_len) % w] = i
+            min_len += 1
+
+            while max_len > 0 and x[qmax[(max_head + max_len - 1) % w]] <= v:
+                max_len -= 1
+            qmax[(max_head + max_len) % w] = i
+            max_len += 1
+
+        # Full window of w non-NaN observations?
+        if i - start >= w - 1 and i - last_nan >= w:
+            out_min[i] = x[qmin[min_head]]
+            out_max[i] = x[qmax[max_head]]
+
+
+@njit(parallel=True, cache=True)
+def rolling_minmax(x, w, group_starts, out_min, out_max):
+    """
+    Per-ticker rolling min and max of x over windows of w rows.
+
+    out_min/out_max must be preallocated and filled with NaN; rows without a
+    full window are left untouched.
+    """
+    for g in prange(len(group_starts) - 1):
+        _minmax_segment(x, w, group_starts[g], group_starts[g + 1], out_min, out_max)
+
+
+# =============================================================================
+# Implied probability and its row-to-row features
+# =============================================================================
+
+@njit(parallel=True, cache=True)
+def fuse_pyes(mid_yes, mid_no, lo, hi, group_starts,
+              out_p, out_over, out_delta, out_accel, out_near):
+    """
+    One pass over mid_yes/mid_no producing p_yes, overround, delta_p,
+    accel_p and near_bounds per ticker.
+
+    - p_yes = mid_yes / (mid_yes + mid_no), falling back to mid_yes when the
+      denominator isn't positive (e.g. no NO book)
+    - near_bounds is p < lo or p > hi (pass lo=eps, hi=1-eps), decided on
+      the float64 p before it is stored, so a float32 out_p can't push a
+      cent-exact price across the threshold
+    - delta/accel are first/second differences; NaN at the start of each ticker
+
+    mid_yes/mid_no should be float64. All outputs must be preallocated with
+    len(mid_yes) rows. p and delta are read back from the outputs so later
+    steps see the stored (possibly float32) values, exactly like the
+    column-by-column pandas version.
+    """
+    for g in prange(len(group_starts) - 1):
+        prev_p = np.nan
+        prev_d = np.nan
+        for i in range(group_starts[g], group_starts[g + 1]):
+            my = mid_yes[i]
+            denom = my + mid_no[i]
+            p_full = my / denom if denom > 0 else my
+            out_p[i] = p_full
+            out_over[i] = denom - 1.0
+            p = out_p[i]
+
+            out_delta[i] = p - prev_p
+            d = out_delta[i]
+            out_accel[i] = d - prev_d
+
+            out_near[i] = p_full < lo or p_full > hi
+
+            prev_p = p
+            prev_d = d
+
+
+# =============================================================================
+# Exponential moving average
+# =============================================================================
+
+@njit(parallel=True, cache=True)
+def groupwise_ewm(values, group_starts, alpha, out):
+    """
+    Per-ticker EWMA, the one-pass recurrence behind pandas'
+    ewm(alpha=alpha, adjust=False).mean().
+
+    Missing values follow pandas' defaults (ignore_na=False): the previous
+    average is carried through the gap and its weight keeps decaying, and
+    rows before the first observation stay NaN. State is accumulated in
+    float64 whatever the dtype of `values`/`out`.
+    """
+    old_wt_factor = 1.0 - alpha
+    for g in prange(len(group_starts) - 1):
+        start = group_starts[g]
+        end = group_starts[g + 1]
+        if start == end:
+            continue
+
+        weighted = float(values[start])
+        old_wt = 1.0
+        out[start] = weighted
+        for i in range(start + 1, end):
+            cur = float(values[i])
+            is_obs = not np.isnan(cur)
+            if not np.isnan(weighted):
+                old_wt *= old_wt_factor
+                if is_obs:
+                    if weighted != cur:
+                        new_wt = alpha
+                        if alpha == 0.5:
+                            # pandas special-cases com == 1 (alpha 0.5) after gaps
+                            new_wt = 1.0 - old_wt
+                        weighted = (old_wt * weighted + new_wt * cur) / (old_wt + new_wt)
+                    old_wt = 1.0
+            elif is_obs:
+                weighted = cur
+            out[i] = weighted
+
+
+# =============================================================================
+# Rolling mean / standard deviation
+# =============================================================================
+
+@njit(cache=True)
+def _mean_std_segment(x, w, start, end, out_mean, out_std):
+    """
+    Rolling mean and sample std (ddof=1) over x[start:end] in O(n).
+
+    Welford's update: each row is added once when it enters the window and
+    removed once when it leaves, instead of re-summing the window. A run of
+    identical values gives exactly 0 std (no cancellation noise), and tiny
+    negative variances from rounding are clamped to 0.
+
+    Matches pandas' rolling(w, min_periods=w): a row gets a value only when
+    the last w rows of its ticker are all non-NaN.
+    """
+    nobs = 0
+    mean = 0.0
+    m2 = 0.0
+    same_run = 0
+    prev = np.nan
+
+    for i in range(start, end):
+        # Row leaving the window
+        j = i - w
+        if j >= start:
+            old = float(x[j])
+            if not np.isnan(old):
+                nobs -= 1
+                if nobs == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    d = old - mean
+                    mean -= d / nobs
+                    m2 -= d * (old - mean)
+
+        # Row entering the window
+        v = float(x[i])
+        if not np.isnan(v):
+            same_run = same_run + 1 if v == prev else 1
+            prev = v
+            nobs += 1
+            d = v - mean
+            mean += d / nobs
+            m2 += d * (v - mean)
+
+        if nobs >= w:
+            out_mean[i] = mean
+            if w > 1:
+                if same_run >= nobs or m2 <= 0.0:
+                    out_std[i] = 0.0
+                else:
+                    out_std[i] = np.sqrt(m2 / (nobs - 1))
+
+
+@njit(parallel=True, cache=True)
+def rolling_mean_std(x, w, group_starts, out_mean, out_std):
+    """
+    Per-ticker rolling mean and std of x over windows of w rows, from one
+    shared set of running sums.
+
+    out_mean/out_std must be preallocated and filled with NaN; rows without a
+    full window are left untouched (std also stays NaN when w == 1).
+    """
+    for g in prange(len(group_starts) - 1):
+        _mean_std_segment(x, w, group_starts[g], group_starts[g + 1], out_mean, out_std)
@@ -8,6 +8,10 @@ Orchestrates the data pipeline:
 3) Optionally compute tradability features / score (snapshot features)
 4) Save an enriched CSV for analysis/backtesting
 
+With --fmt parquet the same pipeline runs as a lazy polars query instead:
+a Parquet (or CSV) input is scanned lazily and streamed through the
+indicators, and the output is written as zstd-compressed Parquet.
+
 Why this file exists:
 - indicators.py should NOT read/write files (pure transformation)
 - collect.py should NOT compute indicators (pure data collection)
@@ -22,14 +26,43 @@ from pathlib import Path
 
 import pandas as pd
 
+# Optional: only needed for --fmt parquet
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Optional: Arrow-backed CSV parsing and column dtypes in load_csv
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+
 # Your modules
-from indicators import add_indicators, IndicatorConfig
+from indicators import add_indicators, add_indicators_lazy, IndicatorConfig
 
 # Optional: only import these if they exist in your repo.
 # If you don't have them yet, leave commented out.
 # from tradability import add_tradability  # (example name)
 
 
+# Columns shown by --head
+PREVIEW_COLUMNS = [
+    "timestamp", "ticker", "mid_yes", "mid_no", "p_yes",
+    "spread_yes", "rel_spread_yes", "overround",
+    "delta_p", "z_p", "vol_p", "ema_diff", "tte_hours",
+]
+
+# Text columns in the collector's CSV. Read as Arrow strings (compact, no
+# per-value Python objects); close_time stays text so pyarrow doesn't turn
+# it into a timestamp.
+STRING_COLUMNS = ["ticker", "title", "event_ticker", "category", "status", "close_time"]
+
+# Book prices are small integers (cents), so int32 is plenty
+PRICE_COLUMNS = ["yes_bid", "yes_ask", "no_bid", "no_ask"]
+
+
 # ---------------------------
 # Helper functions
 # ---------------------------
@@ -45,9 +78,14 @@ def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Compute indicators/tradability from Kalshi snapshot CSV")
 
     p.add_argument("--input", type=str, default="kalshi_markets.csv",
-                   help="Path to input CSV of raw snapshots")
-    p.add_argument("--output", type=str, default="kalshi_markets_with_indicators.csv",
-                   help="Path to output CSV with added features")
+                   help="Path to input CSV (or .parquet with --fmt parquet) of raw snapshots")
+    p.add_argument("--output", type=str, default=None,
+                   help="Path to output file with added features "
+                        "(default: kalshi_markets_with_indicators.csv / .parquet)")
+    p.add_argument("--fmt", choices=["csv", "parquet"], default="csv",
+                   help="csv: pandas pipeline on the CSV. "
+                        "parquet: lazy polars pipeline (Parquet input, or CSV scanned "
+                        "directly) writing Parquet (requires polars)")
 
     # Rolling window parameters (in number of snapshots)
     p.add_argument("--z_window", type=int, default=60, help="Window for z-score (rows)")
@@ -75,7 +113,24 @@ def load_csv(path: Path) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"Input file not found: {path.resolve()}")
 
-    df = pd.read_csv(path)
+    if pa is not None:
+        # Multithreaded pyarrow parser, Arrow-backed columns. Column types go
+        # straight to pyarrow (rather than pd.read_csv(engine="pyarrow")) so
+        # they apply before type inference and close_time really stays text.
+        # strings_can_be_null keeps empty text fields missing (NaN), as
+        # pd.read_csv does, instead of turning them into "".
+        convert = pa_csv.ConvertOptions(
+            column_types={c: pa.string() for c in STRING_COLUMNS},
+            strings_can_be_null=True,
+        )
+        df = pa_csv.read_csv(path, convert_options=convert).to_pandas(types_mapper=pd.ArrowDtype)
+
+        # Downcast integer prices; leave them alone if the file has 0..1 floats
+        for col in PRICE_COLUMNS:
+            if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+                df[col] = df[col].astype("int32[pyarrow]")
+    else:
+        df = pd.read_csv(path)
 
     # Minimal sanity check: must have these columns for indicators to work
     required = ["ticker", "timestamp", "close_time", "yes_bid", "yes_ask", "no_bid", "no_ask"]
@@ -94,6 +149,28 @@ def save_csv(df: pd.DataFrame, path: Path) -> None:
     df.to_csv(path, index=False)
 
 
+def scan_input(path: Path) -> "pl.LazyFrame":
+    """
+    Lazily scan input snapshots, failing loudly if the file is missing.
+    A .csv input is scanned directly as CSV (nothing is written next to
+    it); anything else is scanned as Parquet.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Input file not found: {path.resolve()}")
+    if path.suffix.lower() == ".csv":
+        return pl.scan_csv(path)
+
+    return pl.scan_parquet(path)
+
+
+def save_parquet(df: "pl.DataFrame", path: Path) -> None:
+    """
+    Save output as zstd-compressed Parquet.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.write_parquet(path, compression="zstd")
+
+
 # ---------------------------
 # Main pipeline
 # ---------------------------
@@ -102,16 +179,8 @@ def main() -> int:
     args = parse_args()
 
     in_path = Path(args.input)
-    out_path = Path(args.output)
+    out_path = Path(args.output or f"kalshi_markets_with_indicators.{args.fmt}")
 
-    # 1) Load raw snapshots
-    df = load_csv(in_path)
-
-    # Optional: keep only active markets if you have a 'status' column
-    if args.only_active and "status" in df.columns:
-        df = df[df["status"].astype(str).str.upper().eq("ACTIVE")].copy()
-
-    # 2) Compute indicators
     cfg = IndicatorConfig(
         z_window=args.z_window,
         vol_window=args.vol_window,
@@ -121,6 +190,17 @@ def main() -> int:
         ema_slow=args.ema_slow,
     )
 
+    if args.fmt == "parquet":
+        return run_parquet(args, in_path, out_path, cfg)
+
+    # 1) Load raw snapshots
+    df = load_csv(in_path)
+
+    # Optional: keep only active markets if you have a 'status' column
+    if args.only_active and "status" in df.columns:
+        df = df[df["status"].astype(str).str.upper().eq("ACTIVE")].copy()
+
+    # 2) Compute indicators
     df_feat = add_indicators(df, cfg=cfg)
 
     # 3) Optional: compute tradability features/score
@@ -138,18 +218,49 @@ def main() -> int:
 
     # Show a preview if requested
     if args.head and args.head > 0:
-        cols_preview = [
-            "timestamp", "ticker", "mid_yes", "mid_no", "p_yes",
-            "spread_yes", "rel_spread_yes", "overround",
-            "delta_p", "z_p", "vol_p", "ema_diff", "tte_hours",
-        ]
-        cols_preview = [c for c in cols_preview if c in df_feat.columns]
+        cols_preview = [c for c in PREVIEW_COLUMNS if c in df_feat.columns]
         print("\nPreview:")
         print(df_feat[cols_preview].head(args.head).to_string(index=False))
 
     return 0
 
 
+def run_parquet(args: argparse.Namespace, in_path: Path, out_path: Path, cfg: IndicatorConfig) -> int:
+    """
+    Same pipeline as main(), as one lazy polars query over the scanned
+    input (Parquet, or CSV scanned directly), writing Parquet.
+    Filters are pushed down into the scan and the result is collected with
+    the streaming engine.
+    """
+    if pl is None:
+        raise ImportError("--fmt parquet requires polars (pip install polars)")
+
+    # 1) Scan raw snapshots (nothing is read yet)
+    lf = scan_input(in_path)
+
+    # Optional: keep only active markets if you have a 'status' column
+    if args.only_active and "status" in lf.collect_schema().names():
+        lf = lf.filter(pl.col("status").cast(pl.Utf8).str.to_uppercase() == "ACTIVE")
+
+    # 2) Compute indicators
+    df_feat = add_indicators_lazy(lf, cfg=cfg).collect(engine="streaming")
+
+    # 3) Save enriched output
+    save_parquet(df_feat, out_path)
+
+    # 4) Quick terminal summary
+    print(f"Read input : {in_path}")
+    print(f"Wrote rows : {len(df_feat):,} to   {out_path}")
+    print(f"Columns now: {len(df_feat.columns)} (added indicators)")
+
+    if args.head and args.head > 0:
+        cols_preview = [c for c in PREVIEW_COLUMNS if c in df_feat.columns]
+        print("\nPreview:")
+        print(df_feat.select(cols_preview).head(args.head))
+
+    return 0
+
+
 if __name__ == "__main__":
     # Ensures nice exit codes if something fails
     try:
@@ -0,0 +1,110 @@
+"""
+test_kernels.py
+
+Check the numba kernels (kernels.py) against the pandas groupby operations
+they replace, i.e. the fallback path indicators.py uses without numba.
+
+The data mimics a frame sorted by (ticker, timestamp): contiguous ticker
+blocks, a trailing block of missing tickers (code -1), a single-row ticker,
+NaN gaps (including a run longer than the windows) and runs of identical
+values.
+
+Run with:  python -m pytest -q test_kernels.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("numba")
+
+from indicators import _group_starts
+from kernels import groupwise_ewm, rolling_mean_std, rolling_minmax
+
+
+def _sample():
+    """
+    (values, ticker codes) for a few tickers with NaNs and flat stretches.
+    """
+    rng = np.random.default_rng(7)
+    sizes = [40, 1, 25, 30]
+    codes = np.concatenate([np.full(n, g, dtype=np.int32) for g, n in enumerate(sizes)])
+    # Missing tickers sort last and form one block with code -1
+    codes = np.concatenate([codes, np.full(12, -1, dtype=np.int32)])
+
+    x = rng.uniform(0.05, 0.95, len(codes))
+    x[rng.random(len(codes)) < 0.15] = np.nan
+    x[10:16] = np.nan            # gap longer than the small windows
+    x[20:28] = 0.42              # same-value run (std must be exactly 0)
+    x[45:48] = np.nan            # NaN right at a ticker start
+    return x, codes
+
+
+def _by_ticker(x, codes):
+    return pd.Series(x).groupby(codes, sort=False)
+
+
+def _ungroup(s):
+    return s.droplevel(0).sort_index().to_numpy()
+
+
+@pytest.mark.parametrize("w", [1, 2, 3, 7])
+def test_rolling_minmax_matches_pandas(w):
+    x, codes = _sample()
+    out_min = np.full(len(x), np.nan)
+    out_max = np.full(len(x), np.nan)
+    rolling_minmax(x, w, _group_starts(codes), out_min, out_max)
+
+    roll = _by_ticker(x, codes).rolling(w, min_periods=w)
+    np.testing.assert_array_equal(out_min, _ungroup(roll.min()))
+    np.testing.assert_array_equal(out_max, _ungroup(roll.max()))
+
+
+@pytest.mark.parametrize("w", [1, 2, 5, 10])
+def test_rolling_mean_std_matches_pandas(w):
+    x, codes = _sample()
+    out_mean = np.full(len(x), np.nan)
+    out_std = np.full(len(x), np.nan)
+    rolling_mean_std(x, w, _group_starts(codes), out_mean, out_std)
+
+    roll = _by_ticker(x, codes).rolling(w, min_periods=w)
+    np.testing.assert_allclose(out_mean, _ungroup(roll.mean()), rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(out_std, _ungroup(roll.std()), rtol=1e-9, atol=1e-12)
+
+    # A window entirely inside the same-value run has exactly zero std
+    if 1 < w <= 8:
+        assert out_std[27] == 0.0
+
+
+@pytest.mark.parametrize("span", [1, 3, 10, 30])
+def test_groupwise_ewm_matches_pandas(span):
+    # span 3 is alpha 0.5, where pandas weights observations after a gap
+    # differently (com == 1); the kernel has to reproduce that.
+    x, codes = _sample()
+    alpha = 2.0 / (span + 1.0)
+    out = np.empty(len(x))
+    groupwise_ewm(x, _group_starts(codes), alpha, out)
+
+    expected = _ungroup(_by_ticker(x, codes).ewm(alpha=alpha, adjust=False).mean())
+    np.testing.assert_allclose(out, expected, rtol=1e-12, atol=1e-15)
+
+
+def test_kernels_float32_storage():
+    # float32 inputs/outputs: state is still accumulated in float64, so the
+    # stored values match pandas to float32 precision.
+    x, codes = _sample()
+    x32 = x.astype(np.float32)
+    starts = _group_starts(codes)
+    by_ticker = _by_ticker(x32.astype(np.float64), codes)
+
+    out_mean = np.full(len(x), np.nan, dtype=np.float32)
+    out_std = np.full(len(x), np.nan, dtype=np.float32)
+    rolling_mean_std(x32, 5, starts, out_mean, out_std)
+    roll = by_ticker.rolling(5, min_periods=5)
+    np.testing.assert_allclose(out_mean, _ungroup(roll.mean()), rtol=1e-6, atol=1e-7)
+    np.testing.assert_allclose(out_std, _ungroup(roll.std()), rtol=1e-5, atol=1e-7)
+
+    out = np.empty(len(x), dtype=np.float32)
+    groupwise_ewm(x32, starts, 0.5, out)
+    expected = _ungroup(by_ticker.ewm(alpha=0.5, adjust=False).mean())
+    np.testing.assert_allclose(out, expected, rtol=1e-6, atol=1e-7)
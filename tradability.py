@@ -1,7 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import math
+
+import numpy as np
+
 from microstructure import (
     yes_bid, yes_ask, no_bid, no_ask,
     has_yes_book, has_no_book,
@@ -179,3 +182,80 @@ def tradability_score(m: Dict[str, Any]) -> int:
     )
 
     return int(round(clamp(score, 0.0, 100.0)))
+
+
+# ============================================================
+# Vectorised scoring (many markets at once)
+# ============================================================
+
+def market_arrays(markets: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Struct-of-arrays view of a list of market dicts: one int64 array per
+    numeric field (same columns as the collector's CSV).
+    Values are read with the microstructure accessors, so missing or
+    non-numeric fields become 0 exactly as in the per-market functions.
+    """
+    n = len(markets)
+    fields = {
+        "yes_bid": yes_bid, "yes_ask": yes_ask,
+        "no_bid": no_bid, "no_ask": no_ask,
+        "volume": volume, "open_interest": open_interest,
+    }
+    return {
+        name: np.fromiter((get(m) for m in markets), dtype=np.int64, count=n)
+        for name, get in fields.items()
+    }
+
+
+def tradability_score_vec(
+    yb: np.ndarray,
+    ya: np.ndarray,
+    nb: np.ndarray,
+    na: np.ndarray,
+    vol: np.ndarray,
+    oi: np.ndarray,
+) -> np.ndarray:
+    """
+    tradability_score for every market at once, from integer price and
+    activity arrays (see market_arrays). Same components, weights and
+    rounding as the scalar version, applied as whole-array operations.
+    """
+    has_yes = (yb > 0) & (ya > 0)
+    has_no = (nb > 0) & (na > 0)
+
+    # Best spread: YES book first, NO book as fallback
+    spread = np.where(has_yes, ya - yb, na - nb)
+
+    # Relative YES spread, 0.20 when there is no YES book
+    mid = np.where(has_yes, (yb + ya) / 2.0, 1.0)
+    rel = np.where(has_yes, (ya - yb) / mid, 0.20)
+
+    abs_sp = np.clip(1.0 - (spread / 10.0), 0.0, 1.0)
+    rel_sp = np.clip(1.0 - (rel / 0.30), 0.0, 1.0)
+    vol_c = np.clip(np.log10(1 + np.maximum(vol, 0)) / 2.0, 0.0, 1.0)
+    oi_c = np.clip(np.log10(1 + np.maximum(oi, 0)) / 3.0, 0.0, 1.0)
+    book_factor = np.where(has_yes & has_no, 1.0, 0.7)
+
+    score = (
+        40 * abs_sp +
+        15 * rel_sp +
+        20 * vol_c +
+        15 * oi_c +
+        10 * book_factor
+    )
+
+    # np.rint rounds half to even, like Python's round()
+    out = np.rint(np.clip(score, 0.0, 100.0)).astype(np.int64)
+    out[~(has_yes | has_no)] = 0
+    return out
+
+
+def tradability_scores(markets: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    tradability_score for a whole list of markets (int64 array, same order).
+    """
+    a = market_arrays(markets)
+    return tradability_score_vec(
+        a["yes_bid"], a["yes_ask"], a["no_bid"], a["no_ask"],
+        a["volume"], a["open_interest"],
+    )